@@ -0,0 +1,158 @@
+"""Local load and micro-benchmark runner for the Office System backend.
+
+Runs entirely on this machine: the API and WebSocket suites start the FastAPI
+app under uvicorn on 127.0.0.1, the workflow and analytics suites call the
+engines in-process. Results are written as JSON (p50/p95/p99 in ms, plus
+throughput where it applies) and compared against a saved baseline.
+
+    python benchmarks/bench.py                       # all suites, compare to baseline
+    python benchmarks/bench.py --suite workflows     # one suite
+    python benchmarks/bench.py --suite models        # per-object memory and encode cost
+    python benchmarks/bench.py --save-baseline       # record a new baseline
+    python benchmarks/bench.py --quick               # small sizes for a smoke run
+
+Exit status is 1 when any compared metric regresses beyond --tolerance.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from common import BACKEND_DIR, MEMORY_METRICS, compare, load_json
+
+SUITES = ("api", "ws", "workflows", "analytics", "models")
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--suite", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument("--output", type=Path, default=Path("bench_results.json"))
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="write results to --baseline instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=0.20, help="allowed relative regression (default 0.20)")
+    parser.add_argument("--quick", action="store_true", help="shrink every workload for a fast smoke run")
+    parser.add_argument("--admission", action="store_true",
+                        help="keep admission control enabled; by default it is off so one local client is not rate limited")
+
+    parser.add_argument("--requests", type=int, default=2000, help="HTTP requests per API benchmark")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--upload-sizes", type=int, nargs="+", default=[1024, 64 * 1024, 1024 * 1024, 8 * 1024 * 1024])
+    parser.add_argument("--ws-clients", type=int, nargs="+", default=[1, 10, 100, 500])
+    parser.add_argument("--ws-rounds", type=int, default=50)
+    parser.add_argument("--dag-size", type=int, default=10_000)
+    parser.add_argument("--dag-repeats", type=int, default=3)
+    parser.add_argument("--analytics-events", type=int, default=10_000_000)
+    parser.add_argument("--model-count", type=int, default=100_000, help="documents built for the models suite")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.requests = min(args.requests, 200)
+        args.upload_sizes = [s for s in args.upload_sizes if s <= 1024 * 1024]
+        args.ws_clients = [c for c in args.ws_clients if c <= 10] or [1]
+        args.ws_rounds = min(args.ws_rounds, 10)
+        args.dag_size = min(args.dag_size, 500)
+        args.dag_repeats = 1
+        args.analytics_events = min(args.analytics_events, 50_000)
+        args.model_count = min(args.model_count, 5_000)
+    return args
+
+
+def run_suites(args: argparse.Namespace, workdir: Path) -> dict:
+    results = {}
+
+    if "api" in args.suite or "ws" in args.suite:
+        import main
+        from common import LocalServer
+
+        main.admission.config.enabled = args.admission
+        uploads = workdir / "uploads"
+        uploads.mkdir()
+        with LocalServer(main.app) as server:
+            if "api" in args.suite:
+                import bench_api
+                results.update(bench_api.run(server, main, uploads, args.requests, args.concurrency, args.upload_sizes))
+            if "ws" in args.suite:
+                import bench_websockets
+                results.update(bench_websockets.run(server, main, args.ws_clients, args.ws_rounds))
+
+    if "workflows" in args.suite:
+        import bench_workflows
+        results.update(bench_workflows.run(args.dag_size, args.dag_repeats))
+
+    if "analytics" in args.suite:
+        import bench_analytics
+        storage = workdir / "analytics"
+        results.update(bench_analytics.run(storage, args.analytics_events))
+
+    if "models" in args.suite:
+        import bench_models
+        results.update(bench_models.run(args.model_count, args.dag_size))
+
+    return {name: result.to_dict() for name, result in results.items()}
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    output = args.output.resolve()
+    baseline_path = args.baseline.resolve()
+
+    # main.py resolves its upload directory relative to the working directory,
+    # so run from src/backend exactly like the server does.
+    os.chdir(BACKEND_DIR)
+    with tempfile.TemporaryDirectory(prefix="office-bench-") as tmp:
+        results = run_suites(args, Path(tmp))
+
+    report = {
+        "meta": {
+            "generated_at": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "quick": args.quick,
+            "admission": args.admission,
+        },
+        "results": results,
+    }
+
+    for name, metrics in sorted(results.items()):
+        line = f"{name:40s} p50={metrics['p50']:10.3f}ms p95={metrics['p95']:10.3f}ms p99={metrics['p99']:10.3f}ms"
+        if "throughput" in metrics:
+            line += f" {metrics['throughput']:12.1f} ops/s"
+        if any(key in metrics for key in MEMORY_METRICS):
+            sizes = " ".join(f"{key}={value:.1f}" for key, value in metrics.items() if key.startswith("bytes_per_"))
+            line = f"{name:40s} {sizes}"
+        print(line)
+
+    target = baseline_path if args.save_baseline else output
+    with open(target, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {target}")
+
+    if args.save_baseline:
+        return 0
+
+    baseline = load_json(baseline_path)
+    if baseline is None:
+        print(f"No baseline at {baseline_path}; run with --save-baseline to create one")
+        return 0
+    if baseline.get("meta", {}).get("quick") != args.quick:
+        print("Baseline was recorded with a different --quick setting; skipping comparison")
+        return 0
+
+    regressions = compare(report, baseline, args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print(f"No regressions beyond {args.tolerance:.0%} against {baseline_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+from analytics.analytics_system import AnalyticsConfig, AnalyticsEngine
+from common import BenchResult, Timer
+
+EVENT_TYPES = ("document_upload", "document_view", "workflow_metric")
+
+
+async def _bench(storage_path: Path, events: int, chunk: int, seed: int) -> List[BenchResult]:
+    rng = random.Random(seed)
+    engine = AnalyticsEngine(AnalyticsConfig(storage_path=storage_path))
+    ingest_samples: List[float] = []
+
+    start = time.perf_counter()
+    recorded = 0
+    while recorded < events:
+        batch = min(chunk, events - recorded)
+        with Timer(ingest_samples):
+            for i in range(batch):
+                event_type = EVENT_TYPES[(recorded + i) % len(EVENT_TYPES)]
+                await engine.record_event(event_type, {
+                    "document_id": f"doc_{rng.randrange(100_000)}",
+                    "value": rng.random() * 100,
+                })
+        recorded += batch
+    ingest_elapsed = time.perf_counter() - start
+
+    report_samples: List[float] = []
+    with Timer(report_samples):
+        report = await engine.generate_report(
+            start_date=datetime.now() - timedelta(days=1),
+            end_date=datetime.now() + timedelta(minutes=1),
+        )
+
+    # Every ingested event must be accounted for, otherwise the timing
+    # describes a smaller workload than the one recorded.
+    counts = {event_type: metrics["count"] for event_type, metrics in report["metrics"].items()}
+    expected = {event_type: len(range(i, events, len(EVENT_TYPES))) for i, event_type in enumerate(EVENT_TYPES)}
+    expected = {event_type: n for event_type, n in expected.items() if n}
+    if counts != expected:
+        raise RuntimeError(f"generate_report covered {counts}, expected {expected}")
+
+    return [
+        BenchResult(
+            name="analytics.ingest",
+            samples=ingest_samples,
+            operations=events,
+            elapsed=ingest_elapsed,
+            extra={"events": events, "chunk": chunk},
+        ),
+        BenchResult(
+            name="analytics.generate_report",
+            samples=report_samples,
+            extra={"events": sum(counts.values()), "event_types": len(counts)},
+        ),
+    ]
+
+
+def run(storage_path: Path, events: int, chunk: int = 10_000, seed: int = 0) -> Dict[str, BenchResult]:
+    """AnalyticsEngine.record_event ingest rate and generate_report cost over synthetic events.
+
+    Ingest samples are per ``chunk`` events so percentiles stay meaningful at
+    tens of millions of events.
+    """
+    return {result.name: result for result in asyncio.run(_bench(storage_path, events, chunk, seed))}
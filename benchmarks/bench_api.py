@@ -0,0 +1,81 @@
+import asyncio
+import os
+import time
+from typing import Dict, List
+
+import httpx
+
+from common import BenchResult
+
+
+def _reset_app_state(main, uploads_dir) -> None:
+    main.documents.clear()
+    main.uploads_dir = uploads_dir
+
+
+async def _drive(client: httpx.AsyncClient, total: int, concurrency: int, send) -> BenchResult:
+    samples: List[float] = []
+    queue: asyncio.Queue = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(i)
+
+    async def worker():
+        while True:
+            try:
+                i = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            start = time.perf_counter()
+            response = await send(client, i)
+            samples.append(time.perf_counter() - start)
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+    return BenchResult(name="", samples=samples, operations=total, elapsed=elapsed)
+
+
+async def _bench_documents(base_url: str, total: int, concurrency: int) -> BenchResult:
+    async def send(client, i):
+        return await client.post("/api/documents", json={"title": f"bench-{i}", "content": "x" * 256})
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        result = await _drive(client, total, concurrency, send)
+    result.name = "api.documents"
+    result.extra["concurrency"] = concurrency
+    return result
+
+
+async def _bench_upload(base_url: str, total: int, concurrency: int, size: int) -> BenchResult:
+    payload = os.urandom(size)
+
+    async def send(client, i):
+        files = {"file": (f"bench_{i}.bin", payload, "application/octet-stream")}
+        return await client.post("/api/upload", files=files)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+        result = await _drive(client, total, concurrency, send)
+    result.name = f"api.upload.{size}B"
+    result.extra.update({"concurrency": concurrency, "file_size": size, "bytes_per_sec": size * total / result.elapsed})
+    return result
+
+
+def run(server, main, uploads_dir, requests: int, concurrency: int, upload_sizes: List[int]) -> Dict[str, BenchResult]:
+    """HTTP throughput for /api/documents and /api/upload against a localhost uvicorn."""
+    results = {}
+
+    _reset_app_state(main, uploads_dir)
+    result = asyncio.run(_bench_documents(server.http_url, requests, concurrency))
+    results[result.name] = result
+
+    for size in upload_sizes:
+        _reset_app_state(main, uploads_dir)
+        # Large bodies are dominated by disk writes; scale the count down so
+        # every size moves roughly the same order of bytes.
+        total = max(concurrency, min(requests, (64 * 1024 * 1024) // max(size, 1)))
+        result = asyncio.run(_bench_upload(server.http_url, total, concurrency, size))
+        results[result.name] = result
+
+    _reset_app_state(main, uploads_dir)
+    return results
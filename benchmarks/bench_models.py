@@ -0,0 +1,113 @@
+import asyncio
+import os
+import tracemalloc
+import uuid
+from datetime import datetime
+from typing import Dict, List
+
+from common import BenchResult, Timer
+from models.document_models import Document
+from models.serialization import encode_message
+from bench_workflows import wide_dag
+from workflow.workflow_system import WorkflowEngine, WorkflowStatus
+
+CONTENT_BYTES = 4096
+
+
+def _allocated(build) -> int:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def _content() -> str:
+    return os.urandom(CONTENT_BYTES // 2).hex()
+
+
+def _build_documents(count: int) -> List[Document]:
+    """Documents as create_document keeps them, after their broadcast encode."""
+    docs = []
+    for i in range(count):
+        doc = Document(title=f"doc-{i}", content=_content(), status="new")
+        encode_message("document", doc.encode())
+        docs.append(doc)
+    return docs
+
+
+def _build_dict_documents(count: int) -> List[Dict]:
+    """The plain-dict shape main.py stored before the Document model."""
+    docs = []
+    for i in range(count):
+        now = datetime.now().isoformat()
+        docs.append({
+            "id": str(uuid.uuid4()),
+            "title": f"doc-{i}",
+            "content": _content(),
+            "status": "new",
+            "created_at": now,
+            "updated_at": now
+        })
+    return docs
+
+
+def _bench_document_encode(count: int) -> BenchResult:
+    docs = [Document(title=f"doc-{i}", content=_content(), status="new") for i in range(count)]
+    samples: List[float] = []
+    for doc in docs:
+        with Timer(samples):
+            encode_message("document", doc.encode())
+    return BenchResult(name="models.document.encode", samples=samples, operations=count, elapsed=sum(samples))
+
+
+def _bench_workflow_encode(dag_size: int, repeats: int = 20) -> List[BenchResult]:
+    engine = WorkflowEngine()
+    workflow_id = asyncio.run(engine.create_workflow(wide_dag(dag_size)))
+    workflow = engine.workflows[workflow_id]
+    cold: List[float] = []
+    cached: List[float] = []
+    for i in range(repeats):
+        workflow.status = WorkflowStatus.RUNNING if i % 2 else WorkflowStatus.PENDING
+        with Timer(cold):
+            engine.get_workflow_result_json(workflow_id)
+        with Timer(cached):
+            engine.get_workflow_result_json(workflow_id)
+    return [
+        BenchResult(name="models.workflow.encode", samples=cold, extra={"tasks": dag_size}),
+        BenchResult(name="models.workflow.encode_cached", samples=cached, extra={"tasks": dag_size}),
+    ]
+
+
+def run(count: int, dag_size: int) -> Dict[str, BenchResult]:
+    """Per-object memory and per-message encode cost for documents and workflows."""
+    results = {"models.document.encode": _bench_document_encode(count)}
+    results.update({result.name: result for result in _bench_workflow_encode(dag_size)})
+
+    doc_bytes = _allocated(lambda: _build_documents(count))
+    dict_bytes = _allocated(lambda: _build_dict_documents(count))
+    results["models.document.memory"] = BenchResult(
+        name="models.document.memory",
+        samples=[],
+        extra={
+            "content_bytes": CONTENT_BYTES,
+            "bytes_per_document": doc_bytes / count,
+            "bytes_per_dict_document": dict_bytes / count,
+        },
+    )
+
+    async def build_workflow():
+        engine = WorkflowEngine()
+        await engine.create_workflow(wide_dag(dag_size))
+        return engine
+
+    # Includes the per-task parameter dicts the workflow keeps from its definition.
+    workflow_bytes = _allocated(lambda: asyncio.run(build_workflow()))
+    results["models.workflow.memory"] = BenchResult(
+        name="models.workflow.memory", samples=[], extra={"bytes_per_task": workflow_bytes / dag_size}
+    )
+    return results
@@ -0,0 +1,62 @@
+import asyncio
+import json
+import time
+from typing import Dict, List
+
+import httpx
+import websockets
+
+from common import BenchResult
+
+
+async def _receive_until(ws, doc_id: str) -> float:
+    while True:
+        message = json.loads(await ws.recv())
+        if message.get("type") == "document" and message["payload"].get("id") == doc_id:
+            return time.perf_counter()
+
+
+async def _bench_fanout(server, clients: int, rounds: int) -> BenchResult:
+    sockets = [
+        await websockets.connect(f"{server.ws_url}/ws/documents", max_queue=None)
+        for _ in range(clients)
+    ]
+    samples: List[float] = []
+    broadcast: List[float] = []
+    try:
+        async with httpx.AsyncClient(base_url=server.http_url, timeout=60) as http:
+            for i in range(rounds):
+                start = time.perf_counter()
+                response = await http.post("/api/documents", json={"title": f"fanout-{i}", "content": ""})
+                response.raise_for_status()
+                doc_id = response.json()["id"]
+                arrivals = await asyncio.wait_for(
+                    asyncio.gather(*[_receive_until(ws, doc_id) for ws in sockets]),
+                    timeout=60,
+                )
+                # Per-client delivery latency, plus time until the last client has the message.
+                samples.extend(arrival - start for arrival in arrivals)
+                broadcast.append(max(arrivals) - start)
+    finally:
+        await asyncio.gather(*[ws.close() for ws in sockets], return_exceptions=True)
+
+    result = BenchResult(name=f"ws.documents.fanout.{clients}", samples=samples)
+    last = BenchResult(name="", samples=broadcast).to_dict()
+    result.extra.update({
+        "clients": clients,
+        "rounds": rounds,
+        "broadcast_p50": last["p50"],
+        "broadcast_p99": last["p99"],
+    })
+    return result
+
+
+def run(server, main, client_counts: List[int], rounds: int) -> Dict[str, BenchResult]:
+    """Latency from POST /api/documents until each of N /ws/documents clients receives it."""
+    results = {}
+    for clients in client_counts:
+        main.documents.clear()
+        result = asyncio.run(_bench_fanout(server, clients, rounds))
+        results[result.name] = result
+    main.documents.clear()
+    return results
@@ -0,0 +1,66 @@
+import asyncio
+from typing import Dict, List
+
+from common import BenchResult, Timer
+from workflow.workflow_system import WorkflowEngine
+
+
+def wide_dag(size: int) -> Dict:
+    """``size`` independent tasks, all runnable in the first scheduling round."""
+    return {
+        "name": f"wide-{size}",
+        "tasks": [
+            {"name": f"t{i}", "type": "data_extraction", "parameters": {}}
+            for i in range(size)
+        ],
+    }
+
+
+def deep_dag(size: int) -> Dict:
+    """A single chain of ``size`` tasks, one scheduling round per task."""
+    return {
+        "name": f"deep-{size}",
+        "tasks": [
+            {
+                "name": f"t{i}",
+                "type": "data_extraction",
+                "parameters": {},
+                "depends_on": [f"task_{i - 1}"] if i else [],
+            }
+            for i in range(size)
+        ],
+    }
+
+
+async def _bench_shape(shape: str, definition: Dict, repeats: int) -> List[BenchResult]:
+    create_samples: List[float] = []
+    execute_samples: List[float] = []
+    for _ in range(repeats):
+        engine = WorkflowEngine()
+        with Timer(create_samples):
+            workflow_id = await engine.create_workflow(definition)
+        with Timer(execute_samples):
+            result = await engine.execute_workflow(workflow_id)
+        if result.get("status") != "completed":
+            raise RuntimeError(f"{shape} workflow did not complete: {result.get('error')}")
+
+    tasks = len(definition["tasks"])
+    return [
+        BenchResult(name=f"workflow.{shape}.create", samples=create_samples, extra={"tasks": tasks}),
+        BenchResult(
+            name=f"workflow.{shape}.execute",
+            samples=execute_samples,
+            operations=tasks * repeats,
+            elapsed=sum(execute_samples),
+            extra={"tasks": tasks},
+        ),
+    ]
+
+
+def run(size: int, repeats: int) -> Dict[str, BenchResult]:
+    """WorkflowEngine creation and scheduling cost on wide and deep DAGs."""
+    results = {}
+    for shape, definition in (("wide", wide_dag(size)), ("deep", deep_dag(size))):
+        for result in asyncio.run(_bench_shape(shape, definition, repeats)):
+            results[result.name] = result
+    return results
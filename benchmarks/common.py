@@ -0,0 +1,139 @@
+import json
+import math
+import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BACKEND_DIR = REPO_ROOT / "src" / "backend"
+
+# Backend modules are imported the same way the test suite does
+# (``from workflow.workflow_system import ...``).
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+# Metrics where a larger number is better; everything else is a latency.
+HIGHER_IS_BETTER = {"throughput"}
+MEMORY_METRICS = ("bytes_per_document", "bytes_per_task")
+COMPARED_METRICS = ("p50", "p95", "p99", "throughput") + MEMORY_METRICS
+
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100 * len(sorted_samples)) - 1)
+    return sorted_samples[rank]
+
+
+@dataclass
+class BenchResult:
+    name: str
+    samples: List[float]  # seconds
+    operations: Optional[int] = None
+    elapsed: Optional[float] = None
+    extra: Dict = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        ordered = sorted(self.samples)
+        result = {
+            "unit": "ms",
+            "count": len(ordered),
+            "p50": percentile(ordered, 50) * 1000,
+            "p95": percentile(ordered, 95) * 1000,
+            "p99": percentile(ordered, 99) * 1000,
+            "mean": (sum(ordered) / len(ordered) * 1000) if ordered else 0.0,
+            "min": ordered[0] * 1000 if ordered else 0.0,
+            "max": ordered[-1] * 1000 if ordered else 0.0,
+        }
+        if self.operations is not None and self.elapsed:
+            result["throughput"] = self.operations / self.elapsed
+        result.update(self.extra)
+        return result
+
+
+class Timer:
+    """Context manager recording wall-clock duration into a sample list."""
+
+    def __init__(self, samples: List[float]):
+        self.samples = samples
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.samples.append(time.perf_counter() - self.start)
+        return False
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class LocalServer:
+    """Runs a uvicorn server for an ASGI app in a background thread on localhost."""
+
+    def __init__(self, app, port: Optional[int] = None):
+        import uvicorn
+
+        self.port = port or free_port()
+        config = uvicorn.Config(app, host="127.0.0.1", port=self.port, log_level="warning", lifespan="off")
+        self.server = uvicorn.Server(config)
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    @property
+    def http_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def ws_url(self) -> str:
+        return f"ws://127.0.0.1:{self.port}"
+
+    def __enter__(self):
+        self.thread.start()
+        deadline = time.monotonic() + 10
+        while not self.server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("uvicorn did not start within 10s")
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc):
+        self.server.should_exit = True
+        self.thread.join(timeout=10)
+        return False
+
+
+def load_json(path: Path) -> Optional[Dict]:
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Return a human-readable line for every metric that regressed beyond tolerance."""
+    regressions = []
+    for name, metrics in current.get("results", {}).items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        for metric in COMPARED_METRICS:
+            if metric not in metrics or not base.get(metric):
+                continue
+            now, then = metrics[metric], base[metric]
+            if metric in HIGHER_IS_BETTER:
+                regressed = now < then * (1 - tolerance)
+            else:
+                regressed = now > then * (1 + tolerance)
+            if regressed:
+                change = (now - then) / then * 100
+                regressions.append(f"{name}.{metric}: {then:.3f} -> {now:.3f} ({change:+.1f}%)")
+    return regressions
@@ -0,0 +1,287 @@
+import json
+import math
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import logging
+
+logger = logging.getLogger("Admission")
+
+
+@dataclass
+class RouteLimit:
+    rate: float   # tokens added per second
+    burst: float  # bucket capacity
+
+
+@dataclass
+class AdmissionConfig:
+    enabled: bool = True
+    trust_forwarded_for: bool = False
+    trusted_proxy_hops: int = 1  # proxies that append to X-Forwarded-For in front of the app
+    max_tracked_clients: int = 10000
+    max_concurrent_requests: int = 64
+    max_inflight_upload_bytes: int = 256 * 1024 * 1024
+    max_upload_bytes: int = 50 * 1024 * 1024
+    ws_message_limit: RouteLimit = field(default_factory=lambda: RouteLimit(rate=20, burst=40))
+    routes: Dict[str, RouteLimit] = field(default_factory=lambda: {
+        "/api/upload": RouteLimit(rate=2, burst=10),
+        "/api/documents": RouteLimit(rate=20, burst=50),
+        "/ws/documents": RouteLimit(rate=1, burst=5),
+        "/ws/analytics": RouteLimit(rate=1, burst=5),
+        "/ws/workflows": RouteLimit(rate=1, burst=5),
+    })
+
+    @classmethod
+    def from_file(cls, path: Path) -> "AdmissionConfig":
+        """Load the ``admission`` section of system_config.json, falling back to defaults."""
+        try:
+            with open(path) as f:
+                section = json.load(f).get("admission", {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Using default admission limits, could not read {path}: {e}")
+            section = {}
+
+        config = cls()
+        for key in ("enabled", "trust_forwarded_for", "trusted_proxy_hops", "max_tracked_clients",
+                    "max_concurrent_requests", "max_inflight_upload_bytes", "max_upload_bytes"):
+            if key in section:
+                setattr(config, key, section[key])
+        if "ws_message_limit" in section:
+            config.ws_message_limit = RouteLimit(**section["ws_message_limit"])
+        if "routes" in section:
+            config.routes = {route: RouteLimit(**limit) for route, limit in section["routes"].items()}
+        # Deployments behind a proxy (e.g. Render) opt in from the environment
+        # so the shared config file stays safe for direct local access. This
+        # applies even when the file is missing and defaults are used.
+        trust = os.environ.get("ADMISSION_TRUST_FORWARDED_FOR")
+        if trust is not None:
+            config.trust_forwarded_for = trust.strip().lower() in ("1", "true", "yes")
+        return config
+
+
+class TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def try_acquire(self, amount: float = 1.0) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return True
+        return False
+
+    def retry_after(self, amount: float = 1.0) -> float:
+        """Seconds until ``amount`` tokens are available."""
+        if self.rate <= 0:
+            return float("inf")
+        return max(0.0, (amount - self.tokens) / self.rate)
+
+
+class AdmissionController:
+    """Per-client token buckets plus global caps on in-flight work.
+
+    All checks are synchronous and O(1) so they can run before the request
+    body is read; callers must pair every successful ``admit_request`` with
+    ``release_request``.
+    """
+
+    def __init__(self, config: AdmissionConfig = AdmissionConfig()):
+        self.config = config
+        self.buckets: "OrderedDict[Tuple[str, str], TokenBucket]" = OrderedDict()
+        self.inflight_requests = 0
+        self.inflight_upload_bytes = 0
+        self.counters: Dict[str, int] = {
+            "admitted": 0,
+            "rejected_rate_limited": 0,
+            "rejected_concurrency": 0,
+            "rejected_upload_bytes": 0,
+            "rejected_too_large": 0,
+            "rejected_length_required": 0,
+            "rejected_ws_connect": 0,
+            "rejected_ws_message": 0,
+        }
+
+    def limits(self, route: str) -> bool:
+        return self.config.enabled and route in self.config.routes
+
+    def _bucket(self, client: str, route: str) -> TokenBucket:
+        key = (client, route)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            limit = self.config.routes[route]
+            bucket = TokenBucket(limit.rate, limit.burst)
+            self.buckets[key] = bucket
+            if len(self.buckets) > self.config.max_tracked_clients:
+                # Evicting the least recently seen client only ever hands it a full bucket again.
+                self.buckets.popitem(last=False)
+        else:
+            self.buckets.move_to_end(key)
+        return bucket
+
+    def admit_request(self, client: str, route: str, upload_bytes: Optional[int] = None) -> Tuple[int, float]:
+        """Return ``(status, retry_after)``; status 200 means admitted and reserved.
+
+        ``upload_bytes`` is the declared Content-Length for upload routes; pass
+        ``-1`` when the client did not declare one.
+        """
+        if upload_bytes is not None:
+            if upload_bytes < 0:
+                self.counters["rejected_length_required"] += 1
+                return 411, 0.0
+            if upload_bytes > self.config.max_upload_bytes:
+                self.counters["rejected_too_large"] += 1
+                return 413, 0.0
+
+        # Global caps first: a request turned away because the server is busy
+        # must not also spend the client's tokens.
+        if self.inflight_requests >= self.config.max_concurrent_requests:
+            self.counters["rejected_concurrency"] += 1
+            return 429, 1.0
+        if upload_bytes and self.inflight_upload_bytes + upload_bytes > self.config.max_inflight_upload_bytes:
+            self.counters["rejected_upload_bytes"] += 1
+            return 429, 1.0
+        bucket = self._bucket(client, route)
+        if not bucket.try_acquire():
+            self.counters["rejected_rate_limited"] += 1
+            return 429, bucket.retry_after()
+
+        self.inflight_requests += 1
+        self.inflight_upload_bytes += upload_bytes or 0
+        self.counters["admitted"] += 1
+        return 200, 0.0
+
+    def release_request(self, upload_bytes: Optional[int] = None) -> None:
+        self.inflight_requests -= 1
+        self.inflight_upload_bytes -= upload_bytes or 0
+
+    def admit_websocket(self, client: str, route: str) -> bool:
+        if self._bucket(client, route).try_acquire():
+            return True
+        self.counters["rejected_ws_connect"] += 1
+        return False
+
+    def websocket_message_bucket(self) -> Optional[TokenBucket]:
+        """A fresh per-connection bucket for messages received on a WebSocket."""
+        if not self.config.enabled:
+            return None
+        limit = self.config.ws_message_limit
+        return TokenBucket(limit.rate, limit.burst)
+
+    def admit_websocket_message(self, bucket: Optional[TokenBucket]) -> bool:
+        if bucket is None or bucket.try_acquire():
+            return True
+        self.counters["rejected_ws_message"] += 1
+        return False
+
+    def get_stats(self) -> Dict:
+        return {
+            "enabled": self.config.enabled,
+            "inflight_requests": self.inflight_requests,
+            "max_concurrent_requests": self.config.max_concurrent_requests,
+            "inflight_upload_bytes": self.inflight_upload_bytes,
+            "max_inflight_upload_bytes": self.config.max_inflight_upload_bytes,
+            "tracked_buckets": len(self.buckets),
+            **self.counters,
+        }
+
+
+class AdmissionMiddleware:
+    """ASGI middleware that rejects over-limit work before the body is read.
+
+    HTTP requests on limited routes get 411/413/429 straight from the request
+    headers. WebSocket handshakes over the connection rate are closed before
+    ``accept`` with code 1013 (try again later), which the server turns into
+    a rejected handshake.
+    """
+
+    UPLOAD_ROUTES = ("/api/upload",)
+
+    def __init__(self, app, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+
+    def _client(self, scope) -> str:
+        config = self.controller.config
+        # With no trusted proxy hops every X-Forwarded-For entry is client
+        # supplied, so fall back to the connection address.
+        if config.trust_forwarded_for and config.trusted_proxy_hops >= 1:
+            for name, value in scope.get("headers", []):
+                if name == b"x-forwarded-for":
+                    # Entries left of the ones our proxies appended are client
+                    # supplied and could be forged to dodge the rate limit.
+                    hops = [host.strip() for host in value.decode("latin-1").split(",") if host.strip()]
+                    if hops:
+                        return hops[-min(config.trusted_proxy_hops, len(hops))]
+                    break
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    async def __call__(self, scope, receive, send):
+        route = scope.get("path", "")
+        if scope["type"] not in ("http", "websocket") or not self.controller.limits(route):
+            await self.app(scope, receive, send)
+            return
+
+        client = self._client(scope)
+
+        if scope["type"] == "websocket":
+            if not self.controller.admit_websocket(client, route):
+                await send({"type": "websocket.close", "code": 1013})
+                return
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        upload_bytes = None
+        if route in self.UPLOAD_ROUTES:
+            upload_bytes = -1
+            for name, value in scope.get("headers", []):
+                if name == b"content-length":
+                    try:
+                        upload_bytes = int(value)
+                    except ValueError:
+                        pass
+                    break
+
+        status, retry_after = self.controller.admit_request(client, route, upload_bytes)
+        if status != 200:
+            await self._reject(send, status, retry_after)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release_request(upload_bytes)
+
+    async def _reject(self, send, status: int, retry_after: float) -> None:
+        body = json.dumps({"detail": _REJECT_DETAIL[status]}).encode()
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"connection", b"close"),
+        ]
+        if status == 429:
+            headers.append((b"retry-after", str(max(1, math.ceil(min(retry_after, 3600)))).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+_REJECT_DETAIL = {
+    411: "Content-Length required",
+    413: "Upload too large",
+    429: "Too many requests",
+}
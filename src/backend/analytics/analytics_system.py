@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
 from typing import Dict, List, Optional
 import json
 from datetime import datetime, timedelta
@@ -8,6 +9,9 @@ import asyncio
 from dataclasses import dataclass
 import logging
 
+# The only columns _calculate_metrics looks at; anything else stays on disk.
+REPORT_COLUMNS = ("timestamp", "type", "value")
+
 @dataclass
 class AnalyticsConfig:
     storage_path: Path = Path("analytics_data")
@@ -22,6 +26,7 @@ class AnalyticsEngine:
         self._setup_logging()
         self.metrics: Dict[str, List] = {}
         self.last_update = datetime.now()
+        self._flush_count = 0
 
     def _setup_logging(self) -> None:
         logging.basicConfig(
@@ -55,8 +60,12 @@ class AnalyticsEngine:
 
         df = pd.DataFrame(events)
         
-        # Save raw data
-        file_path = self.config.storage_path / f"{event_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet"
+        # Save raw data; microseconds plus a flush counter keep several
+        # flushes within the same second from overwriting each other.
+        self._flush_count += 1
+        file_path = self.config.storage_path / (
+            f"{event_type}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{self._flush_count}.parquet"
+        )
         df.to_parquet(file_path)
         
         # Clear processed events
@@ -87,18 +96,23 @@ class AnalyticsEngine:
         for event_type in list(self.metrics.keys()):
             await self._process_metrics(event_type)
         
-        # Load and analyze data
-        for file in self.config.storage_path.glob("*.parquet"):
-            df = pd.read_parquet(file)
+        # Load and analyze data, grouping rows by their recorded event type
+        # so every file of a type contributes to that type's metrics.
+        frames: Dict[str, List[pd.DataFrame]] = {}
+        for file in sorted(self.config.storage_path.glob("*.parquet")):
+            available = pq.read_schema(file).names
+            df = pd.read_parquet(file, columns=[c for c in REPORT_COLUMNS if c in available])
             
             # Filter by date range
             df['timestamp'] = pd.to_datetime(df['timestamp'])
             mask = (df['timestamp'] >= start_date) & (df['timestamp'] <= end_date)
             period_data = df.loc[mask]
             
-            if len(period_data) > 0:
-                metrics = self._calculate_metrics(period_data)
-                report["metrics"][file.stem.split('_')[0]] = metrics
+            for event_type, group in period_data.groupby('type'):
+                frames.setdefault(event_type, []).append(group)
+        
+        for event_type, parts in frames.items():
+            report["metrics"][event_type] = self._calculate_metrics(pd.concat(parts, ignore_index=True))
         
         return report
 
@@ -1,4 +1,4 @@
-from fastapi import FastAPI, File, UploadFile, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, File, UploadFile, WebSocket, WebSocketDisconnect, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from datetime import datetime
 import os
@@ -7,10 +7,20 @@ import json
 import uuid
 from pathlib import Path
 import asyncio
+from admission.admission_control import AdmissionConfig, AdmissionController, AdmissionMiddleware
+from models.document_models import Document
+from models.serialization import encode, encode_message
 
 # Initialize FastAPI app
 app = FastAPI(title="Office System API")
 
+# Admission control: per-client rate limits and global in-flight caps, applied
+# before the request body is read. Added ahead of CORS so rejections still
+# carry CORS headers.
+config_path = Path(__file__).resolve().parents[2] / "config" / "system_config.json"
+admission = AdmissionController(AdmissionConfig.from_file(config_path))
+app.add_middleware(AdmissionMiddleware, controller=admission)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -38,15 +48,31 @@ class ConnectionManager:
         if websocket in self.active_connections[connection_type]:
             self.active_connections[connection_type].remove(websocket)
             
-    async def send_message(self, message: dict, connection_type: str):
-        for connection in self.active_connections[connection_type]:
+    async def broadcast(self, data: bytes, connection_type: str):
+        # Encode once, decode once: every socket gets the same text frame.
+        text = data.decode("utf-8")
+        for connection in list(self.active_connections[connection_type]):
             try:
-                await connection.send_json(message)
+                await connection.send_text(text)
             except:
                 pass
 
+    async def send_message(self, message: dict, connection_type: str):
+        await self.broadcast(encode(message), connection_type)
+
 manager = ConnectionManager()
 
+async def send_encoded(websocket: WebSocket, message: dict):
+    await websocket.send_text(encode(message).decode("utf-8"))
+
+async def admit_ws_message(websocket: WebSocket, bucket, connection_type: str) -> bool:
+    """Close the socket with 1013 (try again later) once it exceeds its message rate."""
+    if admission.admit_websocket_message(bucket):
+        return True
+    manager.disconnect(websocket, connection_type)
+    await websocket.close(code=1013)
+    return False
+
 # Basic API route
 @app.get("/")
 async def root():
@@ -56,23 +82,20 @@ async def root():
 @app.websocket("/ws/documents")
 async def websocket_documents(websocket: WebSocket):
     await manager.connect(websocket, "documents")
+    bucket = admission.websocket_message_bucket()
     try:
         # Send initial data
         if documents:
-            await websocket.send_json({
-                "type": "document",
-                "payload": documents[-1]
-            })
+            await websocket.send_text(encode_message("document", documents[-1].encode()).decode("utf-8"))
         
         while True:
             data = await websocket.receive_text()
+            if not await admit_ws_message(websocket, bucket, "documents"):
+                return
             # Just echo back for now
             try:
                 received = json.loads(data)
-                await websocket.send_json({
-                    "type": "document",
-                    "payload": received
-                })
+                await send_encoded(websocket, {"type": "document", "payload": received})
             except:
                 pass
     except WebSocketDisconnect:
@@ -81,9 +104,10 @@ async def websocket_documents(websocket: WebSocket):
 @app.websocket("/ws/analytics")
 async def websocket_analytics(websocket: WebSocket):
     await manager.connect(websocket, "analytics")
+    bucket = admission.websocket_message_bucket()
     try:
         # Send initial analytics data
-        await websocket.send_json({
+        await send_encoded(websocket, {
             "type": "analytics",
             "payload": {
                 "document_count": len(documents),
@@ -95,9 +119,11 @@ async def websocket_analytics(websocket: WebSocket):
         
         while True:
             await websocket.receive_text()
+            if not await admit_ws_message(websocket, bucket, "analytics"):
+                return
             # Keep connection alive with periodic updates
             await asyncio.sleep(5)
-            await websocket.send_json({
+            await send_encoded(websocket, {
                 "type": "analytics",
                 "payload": {
                     "document_count": len(documents),
@@ -112,9 +138,10 @@ async def websocket_analytics(websocket: WebSocket):
 @app.websocket("/ws/workflows")
 async def websocket_workflows(websocket: WebSocket):
     await manager.connect(websocket, "workflows")
+    bucket = admission.websocket_message_bucket()
     try:
         # Send sample workflow data
-        await websocket.send_json({
+        await send_encoded(websocket, {
             "type": "workflow",
             "payload": {
                 "workflow_id": str(uuid.uuid4()),
@@ -132,39 +159,43 @@ async def websocket_workflows(websocket: WebSocket):
         
         while True:
             await websocket.receive_text()
+            if not await admit_ws_message(websocket, bucket, "workflows"):
+                return
     except WebSocketDisconnect:
         manager.disconnect(websocket, "workflows")
 
 # API endpoints
 @app.post("/api/documents")
 async def create_document(document: dict):
-    doc_id = str(uuid.uuid4())
-    now = datetime.now().isoformat()
+    new_doc = Document(
+        title=document.get("title", "Untitled"),
+        content=document.get("content", ""),
+        status="new"
+    )
     
-    new_doc = {
-        "id": doc_id,
-        "title": document.get("title", "Untitled"),
-        "content": document.get("content", ""),
-        "status": "new",
-        "created_at": now,
-        "updated_at": now
-    }
+    # Encode once for both the broadcast and the response; documents do not
+    # keep their encoded form around. Encoding first keeps anything that
+    # cannot be serialised out of the shared document list.
+    try:
+        payload = new_doc.encode()
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=f"Document is not JSON serializable: {e}")
     
     documents.append(new_doc)
     
     # Notify WebSocket clients
-    await manager.send_message({"type": "document", "payload": new_doc}, "documents")
+    await manager.broadcast(encode_message("document", payload), "documents")
     await manager.send_message({
         "type": "analytics",
         "payload": {
             "document_count": len(documents),
             "upload_count": 0,
             "user_actions": len(documents),
-            "timestamp": now
+            "timestamp": new_doc.created_at
         }
     }, "analytics")
     
-    return new_doc
+    return Response(content=payload, media_type="application/json")
 
 @app.get("/api/system-status")
 async def get_system_status():
@@ -174,6 +205,10 @@ async def get_system_status():
         "timestamp": datetime.now().isoformat()
     }
 
+@app.get("/api/admission-stats")
+async def get_admission_stats():
+    return {**admission.get_stats(), "timestamp": datetime.now().isoformat()}
+
 @app.post("/api/upload")
 async def upload_file(file: UploadFile = File(...)):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -185,26 +220,18 @@ async def upload_file(file: UploadFile = File(...)):
         buffer.write(content)
     
     # Create a document for the upload
-    doc_id = str(uuid.uuid4())
-    now = datetime.now().isoformat()
-    
-    new_doc = {
-        "id": doc_id,
-        "title": file.filename,
-        "status": "uploaded",
-        "created_at": now,
-        "updated_at": now
-    }
+    new_doc = Document(title=file.filename, status="uploaded")
+    payload = new_doc.encode()
     
     documents.append(new_doc)
     
     # Notify WebSocket clients
-    await manager.send_message({"type": "document", "payload": new_doc}, "documents")
+    await manager.broadcast(encode_message("document", payload), "documents")
     
     return {
         "success": True,
         "filename": filename,
-        "document_id": doc_id
+        "document_id": new_doc.id
     }
 
 if __name__ == "__main__":
@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Dict, Optional
+import uuid
+
+from models.serialization import encode
+
+
+class Document:
+    """A document record kept in memory for the lifetime of the server.
+
+    The encoded form is deliberately not cached: documents are retained
+    indefinitely and are encoded once per broadcast, so a cache would keep
+    a second copy of the content alive for nothing.
+    """
+
+    __slots__ = ("id", "title", "content", "status", "created_at", "updated_at")
+
+    def __init__(self, title: str, status: str, content: Optional[str] = None,
+                 id: Optional[str] = None, created_at: Optional[datetime] = None):
+        now = created_at or datetime.now()
+        self.id = id or str(uuid.uuid4())
+        self.title = title
+        self.content = content
+        self.status = status
+        self.created_at = now
+        self.updated_at = now
+
+    def to_dict(self) -> Dict:
+        doc = {"id": self.id, "title": self.title}
+        # Uploaded files carry no inline content; keep them off the wire as before.
+        if self.content is not None:
+            doc["content"] = self.content
+        doc.update({
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        })
+        return doc
+
+    def encode(self) -> bytes:
+        return encode(self.to_dict())
@@ -0,0 +1,62 @@
+from datetime import date, datetime
+from typing import Any, Dict, Optional
+import abc
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+def _default(obj: Any) -> str:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# One compact encoder reused for every call when orjson is unavailable, and
+# for values orjson rejects.
+_json_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=_default)
+
+
+def encode(obj: Any) -> bytes:
+    """Encode ``obj`` to compact JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson is stricter than json.dumps (e.g. integers beyond 64
+            # bits); keep accepting whatever the stdlib encoder accepted.
+            pass
+    return _json_encoder.encode(obj).encode("utf-8")
+
+
+def encode_message(message_type: str, payload: bytes) -> bytes:
+    """Wrap already-encoded payload bytes in the ``{"type", "payload"}`` WebSocket envelope."""
+    return b'{"type":%s,"payload":%s}' % (encode(message_type), payload)
+
+
+class EncodedModel(abc.ABC):
+    """Base for slotted models that cache their JSON encoding.
+
+    Subclasses expose every field ``to_dict`` reads either as a read-only
+    property or as a property whose setter calls ``_invalidate()``, so the
+    cached bytes can never go stale and construction stays plain slot
+    writes. Mutating a nested container in place is not tracked; assign a
+    new value instead.
+    """
+
+    __slots__ = ("_encoded",)
+
+    def _invalidate(self) -> None:
+        self._encoded = None
+
+    @abc.abstractmethod
+    def to_dict(self) -> Dict:
+        """Plain-dict form that ``encode()`` serialises."""
+
+    def encode(self) -> bytes:
+        encoded: Optional[bytes] = self._encoded
+        if encoded is None:
+            encoded = self._encoded = encode(self.to_dict())
+        return encoded
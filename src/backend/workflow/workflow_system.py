@@ -1,9 +1,9 @@
 import asyncio
 from typing import Dict, List, Optional
-from dataclasses import dataclass
 from enum import Enum
 import datetime
 import json
+from models.serialization import EncodedModel
 
 class WorkflowStatus(Enum):
     PENDING = "pending"
@@ -17,24 +17,120 @@ class TaskStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
 
-@dataclass
 class WorkflowTask:
-    id: str
-    name: str
-    type: str
-    parameters: Dict
-    depends_on: List[str]
-    status: TaskStatus = TaskStatus.PENDING
-    result: Optional[Dict] = None
-
-@dataclass
-class Workflow:
-    id: str
-    name: str
-    tasks: List[WorkflowTask]
-    status: WorkflowStatus = WorkflowStatus.PENDING
-    created_at: datetime.datetime = datetime.datetime.now()
-    completed_at: Optional[datetime.datetime] = None
+    __slots__ = ("_id", "_name", "type", "parameters", "depends_on", "_status", "_result", "_workflow")
+
+    def __init__(self, id: str, name: str, type: str, parameters: Dict, depends_on: List[str],
+                 status: TaskStatus = TaskStatus.PENDING, result: Optional[Dict] = None):
+        self._id = id
+        self._name = name
+        self.type = type
+        self.parameters = parameters
+        self.depends_on = depends_on
+        self._status = status
+        self._result = result
+        # Set by Workflow.encode() once there is a cached result to invalidate.
+        self._workflow: Optional["Workflow"] = None
+
+    # Fields that appear in the workflow's encoded result are read-only or
+    # drop that cache when assigned.
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def status(self) -> TaskStatus:
+        return self._status
+
+    @status.setter
+    def status(self, value: TaskStatus) -> None:
+        self._status = value
+        if self._workflow is not None:
+            self._workflow._invalidate()
+
+    @property
+    def result(self) -> Optional[Dict]:
+        return self._result
+
+    @result.setter
+    def result(self, value: Optional[Dict]) -> None:
+        self._result = value
+        if self._workflow is not None:
+            self._workflow._invalidate()
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self._id,
+            "name": self._name,
+            "status": self._status.value,
+            "result": self._result
+        }
+
+class Workflow(EncodedModel):
+    __slots__ = ("_id", "name", "_tasks", "_status", "_created_at", "_completed_at")
+
+    def __init__(self, id: str, name: str, tasks: List[WorkflowTask],
+                 status: WorkflowStatus = WorkflowStatus.PENDING,
+                 created_at: Optional[datetime.datetime] = None,
+                 completed_at: Optional[datetime.datetime] = None):
+        self._encoded = None
+        self._id = id
+        self.name = name
+        self._tasks = tasks
+        self._status = status
+        self._created_at = created_at or datetime.datetime.now()
+        self._completed_at = completed_at
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def tasks(self) -> List[WorkflowTask]:
+        return self._tasks
+
+    @property
+    def created_at(self) -> datetime.datetime:
+        return self._created_at
+
+    @property
+    def status(self) -> WorkflowStatus:
+        return self._status
+
+    @status.setter
+    def status(self, value: WorkflowStatus) -> None:
+        self._status = value
+        self._encoded = None
+
+    @property
+    def completed_at(self) -> Optional[datetime.datetime]:
+        return self._completed_at
+
+    @completed_at.setter
+    def completed_at(self, value: Optional[datetime.datetime]) -> None:
+        self._completed_at = value
+        self._encoded = None
+
+    def encode(self) -> bytes:
+        if self._encoded is None:
+            # Link tasks only when there is a cache for them to invalidate,
+            # which keeps workflow creation free of per-task bookkeeping.
+            for task in self._tasks:
+                task._workflow = self
+        return super().encode()
+
+    def to_dict(self) -> Dict:
+        return {
+            "workflow_id": self._id,
+            "status": self._status.value,
+            "tasks": [task.to_dict() for task in self._tasks],
+            "started_at": self._created_at.isoformat(),
+            "completed_at": self._completed_at.isoformat() if self._completed_at else None
+        }
 
 class WorkflowEngine:
     def __init__(self):
@@ -103,10 +199,12 @@ class WorkflowEngine:
             return {"error": str(e)}
 
     def _get_runnable_tasks(self, workflow: Workflow, completed_tasks: set) -> List[WorkflowTask]:
+        # Called once per wave over every task; read the slots behind the
+        # id/status properties directly.
         return [
             task for task in workflow.tasks
-            if task.id not in completed_tasks
-            and task.status != TaskStatus.FAILED
+            if task._id not in completed_tasks
+            and task._status != TaskStatus.FAILED
             and all(dep in completed_tasks for dep in task.depends_on)
         ]
 
@@ -138,21 +236,11 @@ class WorkflowEngine:
         return {"archived": True, "location": "archive/2025/02"}
 
     def _get_workflow_result(self, workflow: Workflow) -> Dict:
-        return {
-            "workflow_id": workflow.id,
-            "status": workflow.status.value,
-            "tasks": [
-                {
-                    "id": task.id,
-                    "name": task.name,
-                    "status": task.status.value,
-                    "result": task.result
-                }
-                for task in workflow.tasks
-            ],
-            "started_at": workflow.created_at.isoformat(),
-            "completed_at": workflow.completed_at.isoformat() if workflow.completed_at else None
-        }
+        return workflow.to_dict()
+
+    def get_workflow_result_json(self, workflow_id: str) -> bytes:
+        """Encoded workflow result, cached until the workflow or one of its tasks changes."""
+        return self.workflows[workflow_id].encode()
 
     def get_workflow_status(self, workflow_id: str) -> Dict:
         workflow = self.workflows[workflow_id]
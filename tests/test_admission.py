@@ -0,0 +1,137 @@
+import json
+import pytest
+from admission.admission_control import (
+    AdmissionConfig,
+    AdmissionController,
+    AdmissionMiddleware,
+    RouteLimit,
+    TokenBucket,
+)
+
+
+def make_controller(**overrides):
+    config = AdmissionConfig(routes={
+        "/api/upload": RouteLimit(rate=0, burst=100),
+        "/api/documents": RouteLimit(rate=0, burst=2),
+        "/ws/documents": RouteLimit(rate=0, burst=1),
+    })
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    return AdmissionController(config)
+
+
+def test_token_bucket_burst_then_reject():
+    bucket = TokenBucket(rate=0, capacity=3)
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+
+def test_rate_limit_is_per_client_and_route():
+    controller = make_controller()
+    assert controller.admit_request("a", "/api/documents")[0] == 200
+    assert controller.admit_request("a", "/api/documents")[0] == 200
+    assert controller.admit_request("a", "/api/documents")[0] == 429
+    assert controller.admit_request("b", "/api/documents")[0] == 200
+    assert controller.get_stats()["rejected_rate_limited"] == 1
+
+
+def test_upload_byte_and_concurrency_caps():
+    controller = make_controller(max_inflight_upload_bytes=100, max_upload_bytes=80, max_concurrent_requests=2)
+    assert controller.admit_request("a", "/api/upload", -1)[0] == 411
+    assert controller.admit_request("a", "/api/upload", 90)[0] == 413
+    assert controller.admit_request("a", "/api/upload", 60)[0] == 200
+    assert controller.admit_request("b", "/api/upload", 60)[0] == 429
+    assert controller.admit_request("b", "/api/upload", 30)[0] == 200
+    assert controller.admit_request("c", "/api/upload", 1)[0] == 429
+
+    controller.release_request(60)
+    controller.release_request(30)
+    stats = controller.get_stats()
+    assert stats["inflight_requests"] == 0
+    assert stats["inflight_upload_bytes"] == 0
+
+
+def test_busy_rejection_does_not_spend_client_tokens():
+    controller = make_controller(max_concurrent_requests=1)
+    assert controller.admit_request("a", "/api/documents")[0] == 200
+    for _ in range(5):
+        assert controller.admit_request("b", "/api/documents")[0] == 429
+    controller.release_request()
+
+    assert controller.admit_request("b", "/api/documents")[0] == 200
+    stats = controller.get_stats()
+    assert stats["rejected_concurrency"] == 5
+    assert stats["rejected_rate_limited"] == 0
+
+
+def test_client_key_from_forwarded_for():
+    controller = make_controller(trust_forwarded_for=True)
+    middleware = AdmissionMiddleware(None, controller)
+    proxy = ("10.0.0.1", 443)
+
+    def scope(forwarded):
+        return {"client": proxy, "headers": [(b"x-forwarded-for", forwarded)]}
+
+    # The proxy appends the real peer; a forged leftmost entry is ignored.
+    assert middleware._client(scope(b"6.6.6.6, 203.0.113.7")) == "203.0.113.7"
+    assert middleware._client(scope(b"203.0.113.7")) == "203.0.113.7"
+    assert middleware._client({"client": proxy, "headers": []}) == "10.0.0.1"
+
+    controller.config.trusted_proxy_hops = 0
+    assert middleware._client(scope(b"6.6.6.6, 203.0.113.7")) == "10.0.0.1"
+
+    controller.config.trusted_proxy_hops = 1
+    controller.config.trust_forwarded_for = False
+    assert middleware._client(scope(b"203.0.113.7")) == "10.0.0.1"
+
+
+def test_forwarded_for_env_override(tmp_path, monkeypatch):
+    path = tmp_path / "system_config.json"
+    path.write_text(json.dumps({"admission": {"trust_forwarded_for": False}}))
+    monkeypatch.setenv("ADMISSION_TRUST_FORWARDED_FOR", "true")
+    assert AdmissionConfig.from_file(path).trust_forwarded_for
+    assert AdmissionConfig.from_file(tmp_path / "missing.json").trust_forwarded_for
+
+
+def test_config_from_file(tmp_path):
+    path = tmp_path / "system_config.json"
+    path.write_text(json.dumps({"admission": {
+        "max_concurrent_requests": 3,
+        "routes": {"/api/documents": {"rate": 1, "burst": 4}},
+    }}))
+    config = AdmissionConfig.from_file(path)
+    assert config.max_concurrent_requests == 3
+    assert config.routes == {"/api/documents": RouteLimit(rate=1, burst=4)}
+
+    assert AdmissionConfig.from_file(tmp_path / "missing.json").enabled
+
+
+@pytest.mark.asyncio
+async def test_middleware_rejects_before_reading_body():
+    controller = make_controller()
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope["path"])
+
+    async def receive():
+        raise AssertionError("body must not be read for rejected requests")
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = AdmissionMiddleware(app, controller)
+    scope = {"type": "http", "method": "POST", "path": "/api/documents", "client": ("1.2.3.4", 1), "headers": []}
+    for _ in range(3):
+        await middleware(scope, receive, send)
+
+    assert calls == ["/api/documents", "/api/documents"]
+    assert sent[0]["status"] == 429
+    assert (b"retry-after", b"3600") in sent[0]["headers"]
+    assert controller.get_stats()["inflight_requests"] == 0
+
+    ws_scope = {"type": "websocket", "path": "/ws/documents", "client": ("1.2.3.4", 1), "headers": []}
+    await middleware(ws_scope, receive, send)
+    await middleware(ws_scope, receive, send)
+    assert sent[-1] == {"type": "websocket.close", "code": 1013}
@@ -0,0 +1,66 @@
+import json
+import pytest
+from models.document_models import Document
+from models.serialization import EncodedModel, encode_message
+from workflow.workflow_system import TaskStatus, WorkflowEngine
+
+
+def test_document_encoding_reflects_current_state():
+    doc = Document(title="Report", content="", status="new")
+    assert json.loads(doc.encode()) == doc.to_dict()
+
+    doc.status = "processed"
+    assert json.loads(doc.encode())["status"] == "processed"
+
+
+def test_uploaded_document_has_no_content_field():
+    doc = Document(title="scan.pdf", status="uploaded")
+    assert "content" not in json.loads(doc.encode())
+    assert not hasattr(doc, "__dict__")
+
+
+def test_message_envelope_wraps_encoded_payload():
+    doc = Document(title="Report", content="x", status="new")
+    message = json.loads(encode_message("document", doc.encode()))
+    assert message == {"type": "document", "payload": doc.to_dict()}
+
+
+def test_encode_accepts_integers_beyond_64_bits():
+    doc = Document(title=1180591620717411303424, content="", status="new")
+    assert json.loads(doc.encode())["title"] == 1180591620717411303424
+
+
+def test_encoded_model_requires_to_dict():
+    class Incomplete(EncodedModel):
+        __slots__ = ()
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+@pytest.mark.asyncio
+async def test_workflow_result_cache_follows_task_changes():
+    engine = WorkflowEngine()
+    workflow_id = await engine.create_workflow({
+        "name": "Cache",
+        "tasks": [{"name": "Extract", "type": "data_extraction", "parameters": {}}]
+    })
+    before = engine.get_workflow_result_json(workflow_id)
+    assert engine.get_workflow_result_json(workflow_id) is before
+
+    result = await engine.execute_workflow(workflow_id)
+    after = engine.get_workflow_result_json(workflow_id)
+    assert after is not before
+    assert json.loads(after) == result
+    assert engine.workflows[workflow_id].tasks[0].status == TaskStatus.COMPLETED
+
+    # Plain attribute writes on a task or the workflow never leave stale bytes.
+    workflow = engine.workflows[workflow_id]
+    workflow.tasks[0].result = {"extracted_data": {}}
+    assert json.loads(engine.get_workflow_result_json(workflow_id))["tasks"][0]["result"] == {"extracted_data": {}}
+    workflow.completed_at = None
+    assert json.loads(engine.get_workflow_result_json(workflow_id))["completed_at"] is None
+
+    # Fields the encoding reads without an invalidating setter are read-only.
+    with pytest.raises(AttributeError):
+        workflow.tasks[0].name = "Renamed"